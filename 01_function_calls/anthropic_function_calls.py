@@ -5,24 +5,67 @@ This demonstrates function calling with Anthropic's Claude models.
 Shows how different LLM providers handle function calling.
 """
 
+import asyncio
 import json
+import logging
 import os
+
+import orjson
 from typing import Dict, Any, List, Optional
 import anthropic
-from basic_function_calling import create_tool_registry, ToolRegistry
+from basic_function_calling import default_registry, ToolRegistry
+from _http import get_http_client
+from cache import ResponseCache, default_response_cache
+from semantic_cache import SemanticCache
+
+# Lazy %-style logging keeps the hot tool-execution path free of string
+# formatting and stdout writes unless a handler actually wants them
+log = logging.getLogger("llm_mcp")
 
 
 class AnthropicFunctionCaller:
     """Wrapper for Anthropic function calling functionality"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True,
+                 semantic_cache: Optional[SemanticCache] = None):
         """Initialize Anthropic client"""
-        self.client = anthropic.Anthropic(api_key=api_key or os.getenv("ANTHROPIC_API_KEY"))
-        self.tool_registry = create_tool_registry()
+        self.client = anthropic.AsyncAnthropic(
+            api_key=api_key or os.getenv("ANTHROPIC_API_KEY"),
+            http_client=get_http_client()
+        )
+        self.tool_registry = default_registry()
         self.conversation_history = []
+        self._anthropic_tools: Optional[List[Dict[str, Any]]] = None
+        self.response_cache = default_response_cache() if use_cache else None
+        self.semantic_cache = semantic_cache
+
+    async def _create_message(self, **params):
+        """Call the messages API, serving exact repeats from the cache"""
+        # Opt into server-side prompt caching of the tool-schema prefix
+        params.setdefault("extra_headers", {"anthropic-beta": "prompt-caching-2024-07-31"})
+
+        if self.response_cache is None:
+            return await self.client.messages.create(**params)
+
+        key = ResponseCache.make_key(
+            params["model"], params["messages"],
+            tools=params.get("tools"), max_tokens=params.get("max_tokens")
+        )
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.client.messages.create(**params)
+        self.response_cache.set(key, response)
+        return response
 
     def convert_tools_for_anthropic(self) -> List[Dict[str, Any]]:
         """Convert OpenAI tool format to Anthropic format"""
+        # The registry never changes after construction, so convert once
+        # and reuse the list on every request
+        if self._anthropic_tools is not None:
+            return self._anthropic_tools
+
         openai_tools = self.tool_registry.get_tool_schemas()
         anthropic_tools = []
 
@@ -35,102 +78,198 @@ class AnthropicFunctionCaller:
             }
             anthropic_tools.append(anthropic_tool)
 
+        # Mark the end of the tool block for server-side prompt caching -
+        # Anthropic caches everything up to and including the marker, so
+        # follow-up requests skip re-prefilling the unchanged schemas
+        if anthropic_tools:
+            anthropic_tools[-1]["cache_control"] = {"type": "ephemeral"}
+
+        self._anthropic_tools = anthropic_tools
         return anthropic_tools
 
-    def execute_function_call(self, tool_use_block) -> Dict[str, Any]:
+    async def execute_function_call(self, tool_use_block) -> Dict[str, Any]:
         """Execute a function call from Claude and return the result"""
         function_name = tool_use_block.name
         arguments = tool_use_block.input
 
-        print(f"🔧 Executing function: {function_name}")
-        print(f"📝 Arguments: {arguments}")
+        log.debug("🔧 Executing function: %s with args: %s", function_name, arguments)
 
-        result = self.tool_registry.execute_tool(function_name, arguments)
+        # Push the synchronous registry call onto a worker thread so
+        # gathered calls genuinely overlap instead of running in sequence
+        result = await asyncio.to_thread(
+            self.tool_registry.execute_tool, function_name, arguments
+        )
 
         if result.success:
-            print(f"✅ Function result: {result.result}")
+            log.debug("✅ Function result: %s", result.result)
             return {"success": True, "result": result.result}
         else:
-            print(f"❌ Function error: {result.error}")
+            log.debug("❌ Function error: %s", result.error)
             return {"success": False, "error": result.error}
 
-    def chat_with_functions(self, user_message: str, model: str = "claude-3-haiku-20240307") -> str:
+    async def chat_with_functions(self, user_message: str, model: str = "claude-3-haiku-20240307") -> str:
         """
         Send a message to Claude with function calling enabled
         """
+        # Check the semantic cache before paying for any API call - a
+        # near-duplicate prompt gets the previously computed answer
+        embedding = None
+        if self.semantic_cache is not None:
+            embedding = await self.semantic_cache.embed(user_message)
+            cached = self.semantic_cache.lookup(embedding)
+            if cached is not None:
+                return cached
+
         try:
             # Prepare messages for Claude
             messages = [{"role": "user", "content": user_message}]
 
             # Make the API call with tools
-            response = self.client.messages.create(
+            response = await self._create_message(
                 model=model,
                 max_tokens=1000,
                 tools=self.convert_tools_for_anthropic(),
                 messages=messages
             )
 
-            # Process the response
-            response_text = ""
-            tool_results = []
+            result_text = await self._execute_and_follow_up(messages, response, model)
 
-            for content_block in response.content:
-                if content_block.type == "text":
-                    response_text += content_block.text
-                elif content_block.type == "tool_use":
-                    # Execute the tool
-                    function_result = self.execute_function_call(content_block)
-                    tool_results.append({
-                        "tool_use_id": content_block.id,
-                        "result": function_result
-                    })
-
-            # If tools were used, get the final response
-            if tool_results:
-                # Create follow-up messages with tool results
-                messages.append({
-                    "role": "assistant",
-                    "content": response.content
-                })
-
-                # Add tool results
-                tool_result_content = []
-                for tool_result in tool_results:
-                    tool_result_content.append({
+            if embedding is not None:
+                self.semantic_cache.add(embedding, result_text)
+            return result_text
+
+        except Exception as e:
+            error_msg = f"Error calling Anthropic API: {str(e)}"
+            print(f"❌ {error_msg}")
+            return error_msg
+
+    async def _execute_and_follow_up(self, messages: List[Dict[str, Any]],
+                                     response, model: str) -> str:
+        """Run any requested tools and fetch Claude's final answer"""
+        # Process the response
+        response_text = ""
+        tool_use_blocks = []
+
+        for content_block in response.content:
+            if content_block.type == "text":
+                response_text += content_block.text
+            elif content_block.type == "tool_use":
+                tool_use_blocks.append(content_block)
+
+        # Execute the tool calls concurrently - they are independent,
+        # so total latency is the slowest tool rather than the sum
+        tool_results = []
+        if tool_use_blocks:
+            function_results = await asyncio.gather(
+                *(self.execute_function_call(block) for block in tool_use_blocks)
+            )
+            tool_results = [
+                {"tool_use_id": block.id, "result": function_result}
+                for block, function_result in zip(tool_use_blocks, function_results)
+            ]
+
+        # If tools were used, get the final response
+        if tool_results:
+            # Create follow-up messages with tool results
+            messages.append({
+                "role": "assistant",
+                "content": response.content
+            })
+
+            # Add tool results - a comprehension lets CPython size the
+            # list once instead of growing it per append
+            messages.append({
+                "role": "user",
+                "content": [
+                    {
                         "type": "tool_result",
                         "tool_use_id": tool_result["tool_use_id"],
-                        "content": json.dumps(tool_result["result"])
-                    })
-
-                messages.append({
-                    "role": "user",
-                    "content": tool_result_content
-                })
-
-                # Get final response after tool execution
-                final_response = self.client.messages.create(
-                    model=model,
-                    max_tokens=1000,
-                    messages=messages
-                )
+                        "content": orjson.dumps(tool_result["result"]).decode()
+                    }
+                    for tool_result in tool_results
+                ]
+            })
+
+            # Get final response after tool execution
+            final_response = await self._create_message(
+                model=model,
+                max_tokens=1000,
+                messages=messages
+            )
+
+            final_text = ""
+            for content_block in final_response.content:
+                if content_block.type == "text":
+                    final_text += content_block.text
 
-                final_text = ""
-                for content_block in final_response.content:
-                    if content_block.type == "text":
-                        final_text += content_block.text
+            return final_text
 
-                return final_text
+        return response_text
 
-            return response_text
+    async def chat_with_functions_batch(self, user_messages: List[str],
+                                        model: str = "claude-3-haiku-20240307") -> List[str]:
+        """
+        Send many independent prompts through the Message Batches API.
+
+        Batch jobs trade latency for a 50% cost reduction, which suits
+        bulk non-interactive workloads like the demo query set. The job is
+        polled until it finishes, then tool execution and the follow-up
+        turn run exactly as in chat_with_functions.
+        """
+        try:
+            requests = [
+                {
+                    "custom_id": f"q{i}",
+                    "params": {
+                        "model": model,
+                        "max_tokens": 1000,
+                        "tools": self.convert_tools_for_anthropic(),
+                        "messages": [{"role": "user", "content": message}],
+                    },
+                }
+                for i, message in enumerate(user_messages)
+            ]
+
+            batch = await self.client.messages.batches.create(requests=requests)
+            print(f"📦 Submitted batch {batch.id} with {len(requests)} requests")
+
+            # Poll until the batch finishes - 20s keeps us well under any
+            # rate limit while staying responsive for small jobs
+            while batch.processing_status != "ended":
+                await asyncio.sleep(20)
+                batch = await self.client.messages.batches.retrieve(batch.id)
+
+            responses: List[str] = [""] * len(user_messages)
+            async for entry in await self.client.messages.batches.results(batch.id):
+                index = int(entry.custom_id[1:])
+                if entry.result.type != "succeeded":
+                    responses[index] = f"Error in batch request: {entry.result.type}"
+                    continue
+
+                messages = [{"role": "user", "content": user_messages[index]}]
+                responses[index] = await self._execute_and_follow_up(
+                    messages, entry.result.message, model
+                )
+
+            return responses
 
         except Exception as e:
-            error_msg = f"Error calling Anthropic API: {str(e)}"
+            error_msg = f"Error calling Anthropic Batch API: {str(e)}"
             print(f"❌ {error_msg}")
-            return error_msg
+            return [error_msg] * len(user_messages)
 
 
-def demonstrate_anthropic_function_calling():
+async def demonstrate_anthropic_function_calling():
     """Demonstrate function calling with Anthropic Claude"""
+    # Show the per-tool-call debug output during the demo - configure
+    # only our logger, not the root logger, so httpx/SDK DEBUG noise
+    # doesn't interleave with the tutorial output
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+    log.setLevel(logging.DEBUG)
+
     print("🤖 Anthropic Claude Function Calling Demonstration\n")
 
     # Check for API key
@@ -167,12 +306,20 @@ def demonstrate_anthropic_function_calling():
         "Calculate the age of someone born in 1992 and also get the weather in London"
     ]
 
-    for i, query in enumerate(test_queries, 1):
+    if os.getenv("BATCH_MODE") == "1":
+        # Bulk path: one batch job, 50% cheaper, minutes of latency
+        responses = await caller.chat_with_functions_batch(test_queries)
+    else:
+        # Run all queries concurrently - the caller keeps no
+        # per-conversation state, so a single instance can serve every query
+        responses = await asyncio.gather(
+            *(caller.chat_with_functions(query) for query in test_queries)
+        )
+
+    for i, (query, response) in enumerate(zip(test_queries, responses), 1):
         print(f"\n{'='*60}")
         print(f"Example {i}: {query}")
         print('='*60)
-
-        response = caller.chat_with_functions(query)
         print(f"\n🤖 Claude: {response}")
 
 
@@ -180,7 +327,7 @@ def compare_function_calling_formats():
     """Compare OpenAI and Anthropic function calling formats"""
     print("🔍 Comparing Function Calling Formats\n")
 
-    registry = create_tool_registry()
+    registry = default_registry()
 
     # Get tools in both formats
     openai_tools = registry.get_tool_schemas()
@@ -211,7 +358,7 @@ if __name__ == "__main__":
     choice = input("\nEnter your choice (1-3): ").strip()
 
     if choice in ["1", "3"]:
-        demonstrate_anthropic_function_calling()
+        asyncio.run(demonstrate_anthropic_function_calling())
 
     if choice in ["2", "3"]:
         print("\n" + "="*60)
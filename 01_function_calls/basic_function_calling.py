@@ -6,18 +6,22 @@ Learn how to define functions, create schemas, and handle responses.
 """
 
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, List, NamedTuple, Optional, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
 
+@dataclass(slots=True, frozen=True)
 class FunctionCallResult:
-    """Represents the result of a function call"""
+    """Represents the result of a function call
 
-    def __init__(self, success: bool, result: Any = None, error: str = None):
-        self.success = success
-        self.result = result
-        self.error = error
+    Slots keep per-result memory down and skip the __dict__ allocation on
+    the hot execute path; frozen results are safe to cache or share.
+    """
+
+    success: bool
+    result: Any = None
+    error: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -27,32 +31,40 @@ class FunctionCallResult:
         }
 
 
+class _Entry(NamedTuple):
+    """Registered tool: the callable plus its LLM-facing schema"""
+    func: Callable
+    schema: Dict[str, Any]
+
+
 class ToolRegistry:
     """Registry for managing available functions/tools"""
 
     def __init__(self):
-        self.tools = {}
+        # One flat name -> entry map; NamedTuple fields are C-level index
+        # lookups, cheaper than a second dict probe per call
+        self._entries: Dict[str, _Entry] = {}
+        self._schema_cache: Optional[Tuple[Dict[str, Any], ...]] = None
 
-    def register_tool(self, name: str, func, schema: Dict[str, Any]):
+    def register_tool(self, name: str, func: Callable, schema: Dict[str, Any]):
         """Register a tool with its function and schema"""
-        self.tools[name] = {
-            "function": func,
-            "schema": schema
-        }
+        self._entries[name] = _Entry(func, schema)
+        self._schema_cache = None
 
-    def get_tool_schemas(self) -> List[Dict[str, Any]]:
+    def get_tool_schemas(self) -> Tuple[Dict[str, Any], ...]:
         """Get all tool schemas for LLM"""
-        return [tool["schema"] for tool in self.tools.values()]
+        if self._schema_cache is None:
+            self._schema_cache = tuple(entry.schema for entry in self._entries.values())
+        return self._schema_cache
 
     def execute_tool(self, name: str, arguments: Dict[str, Any]) -> FunctionCallResult:
         """Execute a tool by name with arguments"""
-        if name not in self.tools:
+        entry = self._entries.get(name)
+        if entry is None:
             return FunctionCallResult(False, error=f"Tool '{name}' not found")
 
         try:
-            func = self.tools[name]["function"]
-            result = func(**arguments)
-            return FunctionCallResult(True, result=result)
+            return FunctionCallResult(True, result=entry.func(**arguments))
         except Exception as e:
             return FunctionCallResult(False, error=str(e))
 
@@ -174,6 +186,20 @@ def create_tool_registry() -> ToolRegistry:
     return registry
 
 
+# Process-wide registry shared by the OpenAI and Anthropic callers - the
+# example tool set is identical everywhere, so there is no reason to
+# re-register it per caller instance
+_DEFAULT_REGISTRY: Optional[ToolRegistry] = None
+
+
+def default_registry() -> ToolRegistry:
+    """Get the shared tool registry, creating it on first use"""
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = create_tool_registry()
+    return _DEFAULT_REGISTRY
+
+
 def demonstrate_function_calling():
     """Demonstrate basic function calling concepts"""
     print("🔧 Basic Function Calling Demonstration\n")
@@ -183,9 +209,9 @@ def demonstrate_function_calling():
 
     # Show available tools
     print("Available tools:")
-    for name, tool in registry.tools.items():
-        desc = tool["schema"]["function"]["description"]
-        print(f"  - {name}: {desc}")
+    for schema in registry.get_tool_schemas():
+        func_info = schema["function"]
+        print(f"  - {func_info['name']}: {func_info['description']}")
 
     print("\n" + "="*50)
 
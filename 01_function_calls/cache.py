@@ -0,0 +1,80 @@
+"""
+Disk-Backed LLM Response Cache
+
+Repeated demo runs and identical development prompts hit the OpenAI and
+Anthropic endpoints every time, paying full token cost and seconds of
+latency. This module provides an exact-match cache: requests are hashed by
+(model, messages, tools, sampling params) and served from SQLite on a hit,
+skipping the network round-trip entirely.
+"""
+
+import hashlib
+import json
+import pickle
+import sqlite3
+import time
+from typing import Any, Optional
+
+
+class ResponseCache:
+    """Exact-match response cache backed by SQLite"""
+
+    def __init__(self, db_path: str = ".llm_response_cache.db"):
+        self.db_path = db_path
+        self._conn = sqlite3.connect(db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB, created_at INTEGER)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(model: str, messages: Any, tools: Any = None,
+                 **params: Any) -> str:
+        """Build a deterministic cache key for a request.
+
+        Include everything that changes the response (model, messages,
+        tools, temperature, tool_choice...); leave out transport-only
+        options like stream or timeout.
+        """
+        payload = {"m": model, "msgs": messages, "tools": tools, "p": params}
+        serialized = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Look up a cached response, or None on a miss"""
+        row = self._conn.execute(
+            "SELECT value FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        return pickle.loads(row[0])
+
+    def set(self, key: str, response: Any):
+        """Store a response under the given key"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, created_at) VALUES (?, ?, ?)",
+            (key, pickle.dumps(response), int(time.time()))
+        )
+        self._conn.commit()
+
+    def clear(self):
+        """Drop all cached responses"""
+        self._conn.execute("DELETE FROM cache")
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        self._conn.close()
+
+
+# Shared default cache so every caller in the process hits the same store
+_default_cache: Optional[ResponseCache] = None
+
+
+def default_response_cache() -> ResponseCache:
+    """Get the process-wide response cache, creating it on first use"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResponseCache()
+    return _default_cache
@@ -5,53 +5,104 @@ This module demonstrates how to use function calling with OpenAI's GPT models.
 Shows real integration with the OpenAI API and proper response handling.
 """
 
-import json
+import asyncio
+import logging
 import os
+
+import orjson
 from typing import Dict, Any, List, Optional
-from openai import OpenAI
-from basic_function_calling import create_tool_registry, ToolRegistry
+from openai import AsyncOpenAI
+from basic_function_calling import default_registry, ToolRegistry
+from _http import get_http_client
+from cache import ResponseCache, default_response_cache
+from semantic_cache import SemanticCache
+
+# Lazy %-style logging keeps the hot tool-execution path free of string
+# formatting and stdout writes unless a handler actually wants them
+log = logging.getLogger("llm_mcp")
 
 
 class OpenAIFunctionCaller:
     """Wrapper for OpenAI function calling functionality"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, use_cache: bool = True,
+                 semantic_cache: Optional[SemanticCache] = None):
         """Initialize OpenAI client"""
-        self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
-        self.tool_registry = create_tool_registry()
+        self.client = AsyncOpenAI(
+            api_key=api_key or os.getenv("OPENAI_API_KEY"),
+            http_client=get_http_client()
+        )
+        self.tool_registry = default_registry()
         self.conversation_history = []
+        self._openai_tools: Optional[List[Dict[str, Any]]] = None
+        self.response_cache = default_response_cache() if use_cache else None
+        self.semantic_cache = semantic_cache
+
+    async def _create_completion(self, **params):
+        """Call the completions API, serving exact repeats from the cache"""
+        if self.response_cache is None:
+            return await self.client.chat.completions.create(**params)
+
+        key = ResponseCache.make_key(
+            params["model"], params["messages"],
+            tools=params.get("tools"), tool_choice=params.get("tool_choice")
+        )
+        cached = self.response_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await self.client.chat.completions.create(**params)
+        self.response_cache.set(key, response)
+        return response
 
     def get_tools_for_openai(self) -> List[Dict[str, Any]]:
         """Get tools in OpenAI format"""
-        return self.tool_registry.get_tool_schemas()
+        # The registry is static after construction - fetch the schemas once
+        if self._openai_tools is None:
+            self._openai_tools = self.tool_registry.get_tool_schemas()
+        return self._openai_tools
 
-    def execute_function_call(self, function_call) -> Dict[str, Any]:
+    async def execute_function_call(self, function_call) -> Dict[str, Any]:
         """Execute a function call from OpenAI and return the result"""
         function_name = function_call.name
-        arguments = json.loads(function_call.arguments)
+        arguments = orjson.loads(function_call.arguments)
 
-        print(f"🔧 Executing function: {function_name}")
-        print(f"📝 Arguments: {arguments}")
+        log.debug("🔧 Executing function: %s with args: %s", function_name, arguments)
 
-        result = self.tool_registry.execute_tool(function_name, arguments)
+        # Push the synchronous registry call onto a worker thread so
+        # gathered calls genuinely overlap instead of running in sequence
+        result = await asyncio.to_thread(
+            self.tool_registry.execute_tool, function_name, arguments
+        )
 
         if result.success:
-            print(f"✅ Function result: {result.result}")
+            log.debug("✅ Function result: %s", result.result)
             return {"success": True, "result": result.result}
         else:
-            print(f"❌ Function error: {result.error}")
+            log.debug("❌ Function error: %s", result.error)
             return {"success": False, "error": result.error}
 
-    def chat_with_functions(self, user_message: str, model: str = "gpt-3.5-turbo") -> str:
+    async def chat_with_functions(self, user_message: str, model: str = "gpt-3.5-turbo") -> str:
         """
         Send a message to OpenAI with function calling enabled
         """
+        # Check the semantic cache before paying for any API call - a
+        # near-duplicate prompt gets the previously computed answer
+        embedding = None
+        if self.semantic_cache is not None:
+            embedding = await self.semantic_cache.embed(user_message)
+            cached = self.semantic_cache.lookup(embedding)
+            if cached is not None:
+                self.conversation_history.append({"role": "user", "content": user_message})
+                self.conversation_history.append({"role": "assistant", "content": cached})
+                return cached
+
         # Add user message to conversation
         self.conversation_history.append({"role": "user", "content": user_message})
 
         try:
             # Make the API call with tools
-            response = self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=model,
                 messages=self.conversation_history,
                 tools=self.get_tools_for_openai(),
@@ -79,19 +130,25 @@ class OpenAIFunctionCaller:
                     ]
                 })
 
-                # Execute each function call
-                for tool_call in message.tool_calls:
-                    function_result = self.execute_function_call(tool_call.function)
+                # Execute the function calls concurrently - they are
+                # independent, so total latency is the slowest tool rather
+                # than the sum of all of them
+                function_results = await asyncio.gather(
+                    *(self.execute_function_call(tc.function) for tc in message.tool_calls)
+                )
 
-                    # Add function result to conversation
-                    self.conversation_history.append({
+                # Add function results to conversation in the original order
+                self.conversation_history.extend(
+                    {
                         "role": "tool",
                         "tool_call_id": tool_call.id,
-                        "content": json.dumps(function_result)
-                    })
+                        "content": orjson.dumps(function_result).decode()
+                    }
+                    for tool_call, function_result in zip(message.tool_calls, function_results)
+                )
 
                 # Get the final response after function execution
-                final_response = self.client.chat.completions.create(
+                final_response = await self._create_completion(
                     model=model,
                     messages=self.conversation_history
                 )
@@ -99,11 +156,15 @@ class OpenAIFunctionCaller:
                 final_message = final_response.choices[0].message.content
                 self.conversation_history.append({"role": "assistant", "content": final_message})
 
+                if embedding is not None:
+                    self.semantic_cache.add(embedding, final_message)
                 return final_message
 
             else:
                 # No function calls needed, just return the response
                 self.conversation_history.append({"role": "assistant", "content": message.content})
+                if embedding is not None:
+                    self.semantic_cache.add(embedding, message.content)
                 return message.content
 
         except Exception as e:
@@ -116,8 +177,17 @@ class OpenAIFunctionCaller:
         self.conversation_history = []
 
 
-def demonstrate_openai_function_calling():
+async def demonstrate_openai_function_calling():
     """Demonstrate function calling with OpenAI"""
+    # Show the per-tool-call debug output during the demo - configure
+    # only our logger, not the root logger, so httpx/SDK DEBUG noise
+    # doesn't interleave with the tutorial output
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+    log.setLevel(logging.DEBUG)
+
     print("🤖 OpenAI Function Calling Demonstration\n")
 
     # Check for API key
@@ -145,8 +215,6 @@ def demonstrate_openai_function_calling():
         return
 
     # Real demonstration with API
-    caller = OpenAIFunctionCaller()
-
     # Example conversations
     test_queries = [
         "What's the weather like in New York?",
@@ -155,17 +223,19 @@ def demonstrate_openai_function_calling():
         "What's the weather in Paris in Fahrenheit and also calculate the age of someone born in 1988?"
     ]
 
-    for i, query in enumerate(test_queries, 1):
+    # Run all queries concurrently - each gets its own caller since
+    # conversation_history is per-instance state
+    callers = [OpenAIFunctionCaller() for _ in test_queries]
+    responses = await asyncio.gather(
+        *(caller.chat_with_functions(query) for caller, query in zip(callers, test_queries))
+    )
+
+    for i, (query, response) in enumerate(zip(test_queries, responses), 1):
         print(f"\n{'='*60}")
         print(f"Example {i}: {query}")
         print('='*60)
-
-        response = caller.chat_with_functions(query)
         print(f"\n🤖 Assistant: {response}")
 
-        # Reset for next example
-        caller.reset_conversation()
-
 
 if __name__ == "__main__":
-    demonstrate_openai_function_calling()
+    asyncio.run(demonstrate_openai_function_calling())
@@ -0,0 +1,72 @@
+"""
+Semantic Response Cache
+
+The exact-match cache in cache.py misses on near-duplicate prompts like
+"weather in Tokyo" vs. "weather in tokyo in celsius" even though they lead
+to the same tool call and answer. This module adds a similarity tier: user
+messages are embedded, compared against recent prompts by cosine
+similarity, and served from the cache when the best match clears a
+threshold - skipping the full prompt prefill and API round-trip.
+
+Requires an OpenAI API key for the embedding calls, so the callers leave
+it disabled unless one is passed in explicitly.
+"""
+
+import os
+from typing import Any, List, Optional
+
+import numpy as np
+from openai import AsyncOpenAI
+
+from _http import get_http_client
+
+
+class SemanticCache:
+    """Similarity-based cache over embedded prompts"""
+
+    def __init__(self, threshold: float = 0.92,
+                 embedding_model: str = "text-embedding-3-small",
+                 api_key: Optional[str] = None):
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self._embed_client = AsyncOpenAI(
+            api_key=api_key or os.getenv("OPENAI_API_KEY"),
+            http_client=get_http_client()
+        )
+        # L2-normalized embeddings stacked row-wise; responses share indices
+        self._embeddings: Optional[np.ndarray] = None
+        self._responses: List[Any] = []
+
+    async def embed(self, text: str) -> np.ndarray:
+        """Embed a prompt and L2-normalize it for cosine similarity"""
+        response = await self._embed_client.embeddings.create(
+            model=self.embedding_model,
+            input=text
+        )
+        vector = np.asarray(response.data[0].embedding, dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def lookup(self, embedding: np.ndarray) -> Optional[Any]:
+        """Return the cached response nearest this prompt, or None.
+
+        Since all stored embeddings are normalized, cosine similarity is a
+        single matrix-vector product. For caches beyond ~1000 entries an
+        ANN index (hnswlib / faiss) would replace the dense product.
+        """
+        if self._embeddings is None:
+            return None
+
+        similarities = self._embeddings @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self._responses[best]
+        return None
+
+    def add(self, embedding: np.ndarray, response: Any):
+        """Store a prompt embedding and its response"""
+        row = embedding.reshape(1, -1)
+        if self._embeddings is None:
+            self._embeddings = row
+        else:
+            self._embeddings = np.vstack([self._embeddings, row])
+        self._responses.append(response)
@@ -7,17 +7,40 @@ Shows the client-side implementation of the MCP protocol.
 
 import asyncio
 import json
+import logging
+import sys
 from typing import Dict, Any, List
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
+# Lazy %-style logging keeps the hot call path free of string formatting
+# and stdout writes unless a handler actually wants them
+log = logging.getLogger("llm_mcp")
+
+# Example invocations per tool, built once at import time so demos don't
+# re-allocate the argument dicts on every run
+_DEMO_ARGS: Dict[str, List[Dict[str, Any]]] = {
+    "echo": [{"message": "Hello from MCP client!"}],
+    "calculate": [
+        {"operation": "add", "a": 15, "b": 27},
+        {"operation": "subtract", "a": 50, "b": 12},
+        {"operation": "multiply", "a": 6, "b": 7},
+        {"operation": "divide", "a": 84, "b": 4}
+    ],
+    "get_system_info": [{}]
+}
+
 
 class MCPClientDemo:
     """Demonstration MCP client"""
 
-    def __init__(self, server_command: List[str]):
+    def __init__(self, server_command: List[str], verbose: bool = True):
         self.server_command = server_command
+        self.verbose = verbose
         self.session = None
+        self._stdio_cm = None
+        self._session_cm = None
+        self._tools_cache = None
 
     async def connect(self):
         """Connect to the MCP server"""
@@ -28,7 +51,13 @@ class MCPClientDemo:
             args=self.server_command[1:] if len(self.server_command) > 1 else []
         )
 
-        self.session = await stdio_client(server_params).__aenter__()
+        # Keep both context managers so disconnect can unwind them - the
+        # stdio transport owns the server subprocess and its pipes, and
+        # dropping it would leak the process and file descriptors
+        self._stdio_cm = stdio_client(server_params)
+        read_stream, write_stream = await self._stdio_cm.__aenter__()
+        self._session_cm = ClientSession(read_stream, write_stream)
+        self.session = await self._session_cm.__aenter__()
 
         # Initialize the session
         await self.session.initialize()
@@ -36,8 +65,27 @@ class MCPClientDemo:
 
         return self.session
 
+    async def disconnect(self):
+        """Tear down the session and the stdio transport, in that order"""
+        if self._session_cm is not None:
+            await self._session_cm.__aexit__(None, None, None)
+            self._session_cm = None
+            self.session = None
+
+        if self._stdio_cm is not None:
+            await self._stdio_cm.__aexit__(None, None, None)
+            self._stdio_cm = None
+
+        # The next connection may talk to a different server
+        self._tools_cache = None
+
     async def list_available_tools(self):
         """List all tools available on the server"""
+        # The tool list is static for the server's lifetime, so one
+        # JSON-RPC round-trip is enough per connection
+        if self._tools_cache is not None:
+            return self._tools_cache
+
         print("\n🔧 Listing available tools...")
 
         try:
@@ -55,6 +103,7 @@ class MCPClientDemo:
                     if properties:
                         print(f"     Parameters: {', '.join(properties.keys())}")
 
+            self._tools_cache = tools.tools
             return tools.tools
 
         except Exception as e:
@@ -63,24 +112,31 @@ class MCPClientDemo:
 
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any] = None):
         """Call a specific tool with arguments"""
-        print(f"\n🚀 Calling tool '{tool_name}' with arguments: {arguments}")
+        log.debug("🚀 Calling tool '%s' with arguments: %s", tool_name, arguments)
 
         try:
             result = await self.session.call_tool(tool_name, arguments or {})
 
-            print("✅ Tool execution successful!")
+            # Skip per-item formatting entirely when output is muted -
+            # the formatting cost dominates for short tool calls
+            if not self.verbose:
+                return result
 
-            # Display results
+            # Collect the lines and flush them in one write so concurrent
+            # calls don't interleave mid-result
+            lines = ["✅ Tool execution successful!\n"]
             if result.content:
-                for i, content in enumerate(result.content):
+                for i, content in enumerate(result.content, 1):
                     if hasattr(content, 'text'):
-                        print(f"📄 Result {i+1}: {content.text}")
+                        lines.append(f"📄 Result {i}: {content.text}\n")
                     elif hasattr(content, 'data'):
-                        print(f"📊 Result {i+1}: [Binary data, {len(content.data)} bytes]")
+                        lines.append(f"📊 Result {i}: [Binary data, {len(content.data)} bytes]\n")
                     else:
-                        print(f"🔍 Result {i+1}: {content}")
+                        lines.append(f"🔍 Result {i}: {content}\n")
             else:
-                print("📭 No content returned")
+                lines.append("📭 No content returned\n")
+
+            sys.stdout.writelines(lines)
 
             return result
 
@@ -105,16 +161,17 @@ class MCPClientDemo:
             print("🎯 Running tool demonstrations...")
             print("="*60)
 
-            # Demonstrate each tool
-            for tool in tools:
-                await self.demonstrate_tool(tool)
+            # Demonstrate the tools concurrently - each demo is an
+            # independent request/response exchange, so overlapping them
+            # hides the per-call round-trip latency (output may interleave)
+            await asyncio.gather(*(self.demonstrate_tool(tool) for tool in tools))
 
         except Exception as e:
             print(f"❌ Demo error: {e}")
 
         finally:
             if self.session:
-                await self.session.__aexit__(None, None, None)
+                await self.disconnect()
                 print("\n👋 Disconnected from MCP server")
 
     async def demonstrate_tool(self, tool):
@@ -124,32 +181,23 @@ class MCPClientDemo:
         print(f"\n📋 Demonstrating: {tool_name}")
         print("-" * 40)
 
-        # Example arguments for different tools
-        example_args = {
-            "echo": {"message": "Hello from MCP client!"},
-            "calculate": {"operation": "add", "a": 15, "b": 27},
-            "get_system_info": {}
-        }
-
-        # Use predefined example or empty args
-        args = example_args.get(tool_name, {})
-
-        await self.call_tool(tool_name, args)
-
-        # For calculate tool, show multiple operations
-        if tool_name == "calculate":
-            operations = [
-                {"operation": "subtract", "a": 50, "b": 12},
-                {"operation": "multiply", "a": 6, "b": 7},
-                {"operation": "divide", "a": 84, "b": 4}
-            ]
-
-            for op_args in operations:
-                await self.call_tool(tool_name, op_args)
+        # Look up the example invocations and fire them in one batch -
+        # the per-tool special-casing lives in _DEMO_ARGS, not in code
+        jobs = _DEMO_ARGS.get(tool_name, [{}])
+        await asyncio.gather(*(self.call_tool(tool_name, args) for args in jobs))
 
 
 async def main():
     """Main demonstration function"""
+    # Show the per-call debug output during the demo - configure only
+    # our logger, not the root logger, so transport and asyncio DEBUG
+    # noise doesn't interleave with the tutorial output
+    if not log.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        log.addHandler(handler)
+    log.setLevel(logging.DEBUG)
+
     print("🤖 MCP Client Demonstration")
     print("="*50)
 
@@ -11,153 +11,179 @@ Run this server and then connect to it with the MCP client example.
 """
 
 import asyncio
+import functools
 import json
+import operator
+import os
+import platform
 from typing import Dict, Any, List, Optional, Sequence
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 import mcp.types as types
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        """Pretty-print via orjson's C encoder (~3-10x faster than json)"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    def _dumps(obj: Any) -> str:
+        """Stdlib fallback when orjson isn't installed"""
+        return json.dumps(obj, indent=2)
+
+
+def _text(msg: str) -> tuple[types.TextContent, ...]:
+    """Wrap a message in the single-item content sequence MCP expects -
+    a tuple is cheaper to allocate and collect than a one-element list,
+    and the framework only iterates the result"""
+    return (types.TextContent(type="text", text=msg),)
+
+
+@functools.lru_cache(maxsize=128)
+def _text_const(msg: str) -> tuple[types.TextContent, ...]:
+    """Cached content for constant messages - skips re-validating the
+    same pydantic model on every error return"""
+    return (types.TextContent(type="text", text=msg),)
+
+
+# C-level operator functions replace the add/subtract/... branch chain
+_OPS = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv
+}
+
+# The platform.* calls shell out or parse /proc on first use and never
+# change for the process lifetime - compute them once at import
+_SYSTEM_INFO = {
+    "platform": platform.platform(),
+    "python_version": platform.python_version(),
+    "architecture": platform.architecture(),
+    "processor": platform.processor()
+}
+
 
 class SimpleMCPServer:
     """A simple MCP server with basic tools"""
 
     def __init__(self):
         self.server = Server("simple-mcp-server")
+        # O(1) name -> handler dispatch instead of an if/elif ladder
+        self._dispatch = {
+            "echo": self._echo,
+            "calculate": self._calculate,
+            "get_system_info": self._get_system_info
+        }
         self.setup_tools()
 
     def setup_tools(self):
         """Register tools with the MCP server"""
 
+        # The tool definitions never change, so build them once here
+        # instead of re-allocating Tool objects on every list_tools call
+        self._tools_cache = [
+            types.Tool(
+                name="echo",
+                description="Echo back the input message",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "message": {
+                            "type": "string",
+                            "description": "Message to echo back"
+                        }
+                    },
+                    "required": ["message"]
+                }
+            ),
+            types.Tool(
+                name="calculate",
+                description="Perform basic mathematical calculations",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "operation": {
+                            "type": "string",
+                            "enum": ["add", "subtract", "multiply", "divide"],
+                            "description": "Mathematical operation to perform"
+                        },
+                        "a": {
+                            "type": "number",
+                            "description": "First number"
+                        },
+                        "b": {
+                            "type": "number",
+                            "description": "Second number"
+                        }
+                    },
+                    "required": ["operation", "a", "b"]
+                }
+            ),
+            types.Tool(
+                name="get_system_info",
+                description="Get basic system information",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "additionalProperties": False
+                }
+            )
+        ]
+
         @self.server.list_tools()
         async def handle_list_tools() -> list[types.Tool]:
             """List available tools"""
-            return [
-                types.Tool(
-                    name="echo",
-                    description="Echo back the input message",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "message": {
-                                "type": "string",
-                                "description": "Message to echo back"
-                            }
-                        },
-                        "required": ["message"]
-                    }
-                ),
-                types.Tool(
-                    name="calculate",
-                    description="Perform basic mathematical calculations",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "operation": {
-                                "type": "string",
-                                "enum": ["add", "subtract", "multiply", "divide"],
-                                "description": "Mathematical operation to perform"
-                            },
-                            "a": {
-                                "type": "number",
-                                "description": "First number"
-                            },
-                            "b": {
-                                "type": "number",
-                                "description": "Second number"
-                            }
-                        },
-                        "required": ["operation", "a", "b"]
-                    }
-                ),
-                types.Tool(
-                    name="get_system_info",
-                    description="Get basic system information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {},
-                        "additionalProperties": False
-                    }
-                )
-            ]
+            return self._tools_cache
 
         @self.server.call_tool()
         async def handle_call_tool(
             name: str, arguments: dict[str, Any] | None
-        ) -> list[types.TextContent | types.ImageContent | types.EmbeddedResource]:
+        ) -> Sequence[types.TextContent | types.ImageContent | types.EmbeddedResource]:
             """Handle tool execution"""
+            handler = self._dispatch.get(name)
+            if handler is None:
+                return _text(f"Error: Unknown tool '{name}'")
 
-            if name == "echo":
-                message = arguments.get("message", "") if arguments else ""
-                return [types.TextContent(
-                    type="text",
-                    text=f"Echo: {message}"
-                )]
-
-            elif name == "calculate":
-                if not arguments:
-                    return [types.TextContent(
-                        type="text",
-                        text="Error: No arguments provided"
-                    )]
-
-                operation = arguments.get("operation")
-                a = arguments.get("a")
-                b = arguments.get("b")
-
-                try:
-                    if operation == "add":
-                        result = a + b
-                    elif operation == "subtract":
-                        result = a - b
-                    elif operation == "multiply":
-                        result = a * b
-                    elif operation == "divide":
-                        if b == 0:
-                            return [types.TextContent(
-                                type="text",
-                                text="Error: Division by zero"
-                            )]
-                        result = a / b
-                    else:
-                        return [types.TextContent(
-                            type="text",
-                            text=f"Error: Unknown operation '{operation}'"
-                        )]
-
-                    return [types.TextContent(
-                        type="text",
-                        text=f"Result: {a} {operation} {b} = {result}"
-                    )]
-
-                except Exception as e:
-                    return [types.TextContent(
-                        type="text",
-                        text=f"Error: {str(e)}"
-                    )]
-
-            elif name == "get_system_info":
-                import platform
-                import os
-
-                info = {
-                    "platform": platform.platform(),
-                    "python_version": platform.python_version(),
-                    "architecture": platform.architecture(),
-                    "processor": platform.processor(),
-                    "current_directory": os.getcwd()
-                }
+            return await handler(arguments)
+
+    async def _echo(self, arguments: dict[str, Any] | None) -> Sequence[types.TextContent]:
+        """Echo the input message back to the caller"""
+        message = arguments.get("message", "") if arguments else ""
+        return _text(f"Echo: {message}")
+
+    async def _calculate(self, arguments: dict[str, Any] | None) -> Sequence[types.TextContent]:
+        """Perform a basic mathematical calculation"""
+        if not arguments:
+            return _text_const("Error: No arguments provided")
+
+        operation = arguments.get("operation")
+        a = arguments.get("a")
+        b = arguments.get("b")
 
-                return [types.TextContent(
-                    type="text",
-                    text=f"System Information:\n{json.dumps(info, indent=2)}"
-                )]
+        op = _OPS.get(operation)
+        if op is None:
+            return _text(f"Error: Unknown operation '{operation}'")
 
-            else:
-                return [types.TextContent(
-                    type="text",
-                    text=f"Error: Unknown tool '{name}'"
-                )]
+        if operation == "divide" and b == 0:
+            return _text_const("Error: Division by zero")
+
+        try:
+            result = op(a, b)
+
+            return _text(f"Result: {a} {operation} {b} = {result}")
+
+        except Exception as e:
+            return _text(f"Error: {str(e)}")
+
+    async def _get_system_info(self, arguments: dict[str, Any] | None) -> Sequence[types.TextContent]:
+        """Report basic information about the host system"""
+        # Only the working directory can change between calls
+        info = {**_SYSTEM_INFO, "current_directory": os.getcwd()}
+
+        return _text(f"System Information:\n{_dumps(info)}")
 
 
 async def main():
@@ -198,6 +224,15 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Prefer uvloop's libuv-based event loop when available - it cuts
+    # per-callback and I/O dispatch overhead without any code changes
+    # (not available on Windows, hence the silent fallback)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Run the async main function
     try:
         asyncio.run(main())